@@ -1,11 +1,18 @@
+import asyncio
 from typing import Optional
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from aiogram.webhook.aiohttp_server import (
+    SimpleRequestHandler,
+    setup_application,
+)
+from aiohttp import web
 from loguru import logger
 
 from bot.handlers.commands import CommandHandlers
+from bot.middleware.batch_middleware import BatchStatusMiddleware
 from bot.middleware.middleware import AuthMiddleware
 from bot.models.bot_config import BotConfig
 from bot.services.parser_manager import ParserManager
@@ -18,6 +25,7 @@ class TelegramBot:
         self.dp: Optional[Dispatcher] = None
         self.parser_manager: Optional[ParserManager] = None
         self.command_handlers: Optional[CommandHandlers] = None
+        self.webhook_runner: Optional[web.AppRunner] = None
 
     async def initialize(self):
 
@@ -29,7 +37,7 @@ class TelegramBot:
         self.dp = Dispatcher()
 
         auth_middleware = AuthMiddleware(self.config)
-        self.dp.message.middleware(auth_middleware)
+        self.dp.message.outer_middleware(auth_middleware)
 
         self.parser_manager = ParserManager(self.config, self.bot)
         await self.parser_manager.initialize()
@@ -38,6 +46,14 @@ class TelegramBot:
             self.config, self.parser_manager
         )
 
+        self.dp.message.middleware(
+            BatchStatusMiddleware(
+                {
+                    "status": self.command_handlers.build_status_text,
+                    "help": self.command_handlers.build_help_text,
+                }
+            )
+        )
         self.dp.include_router(self.command_handlers.router)
 
         await self.command_handlers.setup_commands(self.bot)
@@ -48,21 +64,53 @@ class TelegramBot:
         if not self.bot or not self.dp:
             raise RuntimeError("Bot not initialized. Call initialize() first.")
 
-        await self.dp.start_polling(self.bot)
-        logger.info("Telegram bot started")
+        if self.config.webhook.enabled:
+            await self._start_webhook()
+        else:
+            await self.dp.start_polling(self.bot)
+            logger.info("Telegram bot started")
+
+    async def _start_webhook(self):
+        webhook = self.config.webhook
+        secret_token = webhook.secret_token or None
+
+        app = web.Application()
+        SimpleRequestHandler(
+            dispatcher=self.dp, bot=self.bot, secret_token=secret_token
+        ).register(app, path=webhook.path)
+        setup_application(app, self.dp, bot=self.bot)
+
+        self.webhook_runner = web.AppRunner(app)
+        await self.webhook_runner.setup()
+        site = web.TCPSite(self.webhook_runner, webhook.host, webhook.port)
+        await site.start()
+
+        await self.bot.set_webhook(
+            url=webhook.url.rstrip("/") + webhook.path,
+            secret_token=secret_token,
+        )
+        logger.bind(
+            host=webhook.host, port=webhook.port, path=webhook.path
+        ).info("Telegram bot started (webhook)")
+
+        await asyncio.Event().wait()
 
     async def stop(self):
         logger.info("Stopping Telegram bot...")
 
+        # The parser manager still sends its final messages through the bot
+        # session, and both polling and webhook teardown close that session,
+        # so it has to finish first.
         if self.parser_manager:
-            await self.parser_manager.close()
-
-        if self.dp:
             try:
-                await self.dp.stop_polling()
-                logger.info("Polling stopped successfully")
+                await self.parser_manager.close()
             except Exception as e:
-                logger.warning(f"Error stopping polling: {e}")
+                logger.warning(f"Error closing parser manager: {e}")
+
+        if self.webhook_runner:
+            await self._stop_webhook()
+        elif self.dp:
+            await self._stop_polling()
 
         if self.bot:
             try:
@@ -73,6 +121,25 @@ class TelegramBot:
 
         logger.info("Telegram bot stopped")
 
+    async def _stop_webhook(self):
+        try:
+            if self.bot:
+                await self.bot.delete_webhook()
+            if self.webhook_runner:
+                await self.webhook_runner.cleanup()
+                self.webhook_runner = None
+            logger.info("Webhook stopped successfully")
+        except Exception as e:
+            logger.warning(f"Error stopping webhook: {e}")
+
+    async def _stop_polling(self):
+        try:
+            if self.dp:
+                await self.dp.stop_polling()
+            logger.info("Polling stopped successfully")
+        except Exception as e:
+            logger.warning(f"Error stopping polling: {e}")
+
     async def __aenter__(self):
         await self.initialize()
         return self
@@ -1,91 +1,155 @@
-from aiogram import Router
+import hashlib
+import re
+from datetime import datetime
+from typing import Final, Optional
+
+from aiogram import F, Router
 from aiogram.filters import Command
-from aiogram.types import BotCommand, Message
+from aiogram.types import BotCommand, FSInputFile, Message
 from loguru import logger
 
 from bot.models.bot_config import BotConfig
 from bot.services.parser_manager import ParserManager
+from shared.utils.ttl_cache import TTLCache
+
+BOT_COMMANDS: Final[tuple[BotCommand, ...]] = (
+    BotCommand(command="start", description="Запустить парсинг"),
+    BotCommand(command="stop", description="Остановить парсинг"),
+    BotCommand(command="status", description="Статус парсера"),
+    BotCommand(command="seturl", description="Установить ссылку"),
+    BotCommand(command="dbstats", description="Статистика БД"),
+    BotCommand(command="sqldump", description="SQL дамп БД"),
+    BotCommand(command="exportdb", description="Экспорт из БД"),
+    BotCommand(command="cleardb", description="Очистить БД"),
+    BotCommand(command="help", description="Справка"),
+)
+
+COMMANDS_HASH_FILE: Final[str] = ".commands_hash"
+
+_MOBILE_URL_RE: Final[re.Pattern[str]] = re.compile(
+    r"^https://(?:www\.)?mobile\.de/ru/"
+)
+
+STATUS_TEMPLATE: Final[str] = (
+    "• Статус парсера:\n\n"
+    "• Работает: {is_running}\n"
+    "• Интервал: {interval} сек\n"
+    "• Цикл: {cycle}\n"
+    "• Макс. потоков: {max_concurrency}"
+)
+
+HELP_TEXT: Final[str] = (
+    "• Справка по командам:\n\n"
+    "• /start - Запустить парсинг Mobile.de\n"
+    "• /stop - Остановить текущий парсинг\n"
+    "• /status - Показать статус парсера\n"
+    "• /seturl - Установить ссылку для парсинга\n"
+    "• /dbstats - Статистика базы данных\n"
+    "• /sqldump - Создать SQL дамп базы\n"
+    "• /exportdb - Экспорт всех продуктов из БД\n"
+    "• /cleardb - Очистить базу данных\n"
+    "• /help - Показать эту справку\n\n"
+    "• Просто отправьте ссылку на страницу Mobile.de для парсинга\n"
+    "После завершения парсинга вы получите архив с результатами."
+)
+
+SETURL_PROMPT: Final[str] = (
+    "• Отправьте ссылку на страницу Mobile.de для парсинга.\n"
+    "Ссылка должна начинаться с https://mobile.de/ru/\n\n"
+    "• Ожидаю ссылку..."
+)
+
+URL_SET_TEMPLATE: Final[str] = (
+    "• Ссылка установлена: {url}\n"
+    "Теперь можете запустить парсинг командой /start"
+)
+
+URL_INVALID_TEXT: Final[str] = (
+    "• Неверный формат ссылки!\n"
+    "Ссылка должна начинаться с https://mobile.de/ru/\n\n"
+    "• Попробуйте еще раз или отправьте /seturl для отмены"
+)
+
+NOT_A_LINK_TEXT: Final[str] = (
+    "• Это не похоже на ссылку.\n"
+    "Отправьте ссылку, начинающуюся с https://mobile.de/ru/\n\n"
+    "• Попробуйте еще раз или отправьте /seturl для отмены"
+)
+
+DB_STATS_TEMPLATE: Final[str] = (
+    "• Статистика базы данных:\n\n"
+    "• Всего продуктов: {total_products:,}\n"
+    "• Путь к БД: {database_path}\n\n"
+    "• База данных автоматически фильтрует дубли при парсинге"
+)
+
+PARSING_STOPPED_TEXT: Final[str] = "• Парсинг остановлен"
 
 
 class CommandHandlers:
+    _ROUTES: Final[tuple[tuple[str, str], ...]] = (
+        ("start", "start_command"),
+        ("stop", "stop_command"),
+        ("status", "status_command"),
+        ("help", "help_command"),
+        ("seturl", "seturl_command"),
+        ("dbstats", "database_stats_command"),
+        ("sqldump", "sql_dump_command"),
+        ("exportdb", "export_db_command"),
+        ("cleardb", "clear_database_command"),
+    )
+
     def __init__(self, config: BotConfig, parser_manager: ParserManager):
         self.config = config
         self.parser_manager = parser_manager
         self.router = Router()
-        self.users_waiting_for_url = set()
+        self.users_waiting_for_url = TTLCache(maxsize=10_000, ttl=300)
         self._setup_handlers()
 
     def _setup_handlers(self):
-        self.router.message.register(self.start_command, Command("start"))
-        self.router.message.register(self.stop_command, Command("stop"))
-        self.router.message.register(self.status_command, Command("status"))
-        self.router.message.register(self.help_command, Command("help"))
-        self.router.message.register(self.seturl_command, Command("seturl"))
-        self.router.message.register(
-            self.database_stats_command, Command("dbstats")
-        )
-        self.router.message.register(self.sql_dump_command, Command("sqldump"))
-        self.router.message.register(
-            self.export_db_command, Command("exportdb")
-        )
-        self.router.message.register(
-            self.clear_database_command, Command("cleardb")
-        )
+        for command, handler_name in self._ROUTES:
+            self.router.message.register(
+                getattr(self, handler_name), Command(command)
+            )
         self.router.message.register(
-            self.handle_url_message,
-            lambda message: self._is_url_message(message),
+            self.handle_url_message, F.text.regexp(r"^\s*http")
         )
         self.router.message.register(self.handle_text_message)
 
-    def _is_url_message(self, message: Message) -> bool:
-        if not message.text:
-            return False
-        text = message.text.strip()
-        return text.startswith("http")
-
     async def start_command(self, message: Message):
         result = await self.parser_manager.start_parsing(message.chat.id)
         await message.answer(f"• {result}")
 
     async def stop_command(self, message: Message):
         await self.parser_manager.stop_parsing()
-        await message.answer("• Парсинг остановлен")
+        await message.answer(PARSING_STOPPED_TEXT)
 
-    async def status_command(self, message: Message):
+    async def status_command(
+        self, message: Message, cached_response: Optional[str] = None
+    ):
+        await message.answer(cached_response or self.build_status_text())
+
+    async def help_command(
+        self, message: Message, cached_response: Optional[str] = None
+    ):
+        await message.answer(cached_response or HELP_TEXT)
+
+    def build_status_text(self) -> str:
         status = self.parser_manager.get_status()
-        status_text = (
-            f"• Статус парсера:\n\n"
-            f"• Работает: {'Да' if status.is_running else 'Нет'}\n"
-            f"• Интервал: {status.interval_seconds} сек\n"
-            f"• Цикл: {'Включен' if status.cycle_enabled else 'Отключен'}\n"
-            f"• Макс. потоков: {status.max_concurrency}"
-        )
-        await message.answer(status_text)
-
-    async def help_command(self, message: Message):
-        help_text = (
-            "• Справка по командам:\n\n"
-            "• /start - Запустить парсинг Mobile.de\n"
-            "• /stop - Остановить текущий парсинг\n"
-            "• /status - Показать статус парсера\n"
-            "• /seturl - Установить ссылку для парсинга\n"
-            "• /dbstats - Статистика базы данных\n"
-            "• /sqldump - Создать SQL дамп базы\n"
-            "• /exportdb - Экспорт всех продуктов из БД\n"
-            "• /cleardb - Очистить базу данных\n"
-            "• /help - Показать эту справку\n\n"
-            "• Просто отправьте ссылку на страницу Mobile.de для парсинга\n"
-            "После завершения парсинга вы получите архив с результатами."
+        return STATUS_TEMPLATE.format(
+            is_running="Да" if status.is_running else "Нет",
+            interval=status.interval_seconds,
+            cycle="Включен" if status.cycle_enabled else "Отключен",
+            max_concurrency=status.max_concurrency,
         )
-        await message.answer(help_text)
+
+    @staticmethod
+    def build_help_text() -> str:
+        return HELP_TEXT
 
     async def seturl_command(self, message: Message):
-        self.users_waiting_for_url.add(message.chat.id)
-        await message.answer(
-            "• Отправьте ссылку на страницу Mobile.de для парсинга.\n"
-            "Ссылка должна начинаться с https://mobile.de/ru/\n\n"
-            "• Ожидаю ссылку..."
-        )
+        self.users_waiting_for_url[message.chat.id] = True
+        await message.answer(SETURL_PROMPT)
 
     async def handle_url_message(self, message: Message):
         text = message.text
@@ -94,59 +158,33 @@ class CommandHandlers:
 
         text = text.strip()
 
-        if text.startswith("http"):
-            if text.startswith("https://mobile.de/ru/") or text.startswith(
-                "https://www.mobile.de/ru/"
-            ):
-                self.config.parser.base_search_url = text
+        if _MOBILE_URL_RE.match(text):
+            chat_id = message.chat.id
+            self.config.parser.base_search_url = text
 
-                self.users_waiting_for_url.discard(message.chat.id)
+            self.users_waiting_for_url.pop(chat_id, None)
 
-                await message.answer(
-                    f"• Ссылка установлена: {text}\n"
-                    f"Теперь можете запустить парсинг командой /start"
-                )
-                logger.bind(
-                    service="Commands", chat_id=message.chat.id, url=text
-                ).info("URL set by user")
-            else:
-                await message.answer(
-                    "• Неверный формат ссылки!\n"
-                    "Ссылка должна начинаться с https://mobile.de/ru/\n\n"
-                    "• Попробуйте еще раз или отправьте /seturl для отмены"
-                )
+            await message.answer(URL_SET_TEMPLATE.format(url=text))
+            logger.bind(service="Commands", chat_id=chat_id, url=text).info(
+                "URL set by user"
+            )
         else:
-            if message.chat.id in self.users_waiting_for_url:
-                await message.answer(
-                    "• Это не похоже на ссылку.\n"
-                    "Отправьте ссылку, начинающуюся с https://mobile.de/ru/\n\n"
-                    "• Попробуйте еще раз или отправьте /seturl для отмены"
-                )
+            await message.answer(URL_INVALID_TEXT)
 
     async def handle_text_message(self, message: Message):
         if message.chat.id in self.users_waiting_for_url:
-            await message.answer(
-                "• Это не похоже на ссылку.\n"
-                "Отправьте ссылку, начинающуюся с https://mobile.de/ru/\n\n"
-                "• Попробуйте еще раз или отправьте /seturl для отмены"
-            )
+            await message.answer(NOT_A_LINK_TEXT)
 
     async def database_stats_command(self, message: Message):
         try:
-            stats = self.parser_manager.get_database_stats()
+            stats = await self.parser_manager.get_database_stats()
             if "error" in stats:
                 await message.answer(
                     f"• Ошибка получения статистики: {stats['error']}"
                 )
                 return
 
-            stats_text = (
-                f"• Статистика базы данных:\n\n"
-                f"• Всего продуктов: {stats['total_products']:,}\n"
-                f"• Путь к БД: {stats['database_path']}\n\n"
-                f"• База данных автоматически фильтрует дубли при парсинге"
-            )
-            await message.answer(stats_text)
+            await message.answer(DB_STATS_TEMPLATE.format_map(stats))
 
         except Exception as e:
             await message.answer(f"• Ошибка: {str(e)}")
@@ -155,12 +193,10 @@ class CommandHandlers:
         try:
             await message.answer("• Создаю SQL дамп базы данных...")
 
-            from datetime import datetime
-
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             dump_path = f"database_dump_{timestamp}.sql"
 
-            success = self.parser_manager.create_sql_dump(dump_path)
+            success = await self.parser_manager.create_sql_dump(dump_path)
 
             if success:
                 await message.answer(
@@ -186,8 +222,6 @@ class CommandHandlers:
             if result:
                 archive_paths, exported_count = result
 
-                from aiogram.types import FSInputFile
-
                 if len(archive_paths) == 1:
                     # Single archive - send as before
                     document = FSInputFile(str(archive_paths[0]))
@@ -231,7 +265,7 @@ class CommandHandlers:
         try:
             await message.answer("• Очищаю базу данных...")
 
-            success = self.parser_manager.clear_database()
+            success = await self.parser_manager.clear_database()
 
             if success:
                 await message.answer(
@@ -249,20 +283,22 @@ class CommandHandlers:
             await message.answer(f"• Ошибка: {str(e)}")
 
     async def setup_commands(self, bot):
-        commands = [
-            BotCommand(command="start", description="Запустить парсинг"),
-            BotCommand(command="stop", description="Остановить парсинг"),
-            BotCommand(command="status", description="Статус парсера"),
-            BotCommand(command="seturl", description="Установить ссылку"),
-            BotCommand(command="dbstats", description="Статистика БД"),
-            BotCommand(command="sqldump", description="SQL дамп БД"),
-            BotCommand(command="exportdb", description="Экспорт из БД"),
-            BotCommand(command="cleardb", description="Очистить БД"),
-            BotCommand(command="help", description="Справка"),
-        ]
+        commands_hash = hashlib.blake2b(
+            f"{bot.id}:{BOT_COMMANDS!r}".encode()
+        ).hexdigest()
+        hash_path = self.config.files.files_dir / COMMANDS_HASH_FILE
 
         try:
-            await bot.set_my_commands(commands)
+            if hash_path.read_text(encoding="utf-8") == commands_hash:
+                logger.bind(service="Commands").info(
+                    "Bot commands unchanged, skipping registration"
+                )
+                return
+        except OSError:
+            pass
+
+        try:
+            await bot.set_my_commands(list(BOT_COMMANDS))
             logger.bind(service="Commands").info(
                 "Bot commands set successfully"
             )
@@ -272,3 +308,13 @@ class CommandHandlers:
                 error_type=type(e).__name__,
                 error_message=str(e),
             ).error("Failed to set bot commands")
+            return
+
+        try:
+            hash_path.write_text(commands_hash, encoding="utf-8")
+        except OSError as e:
+            logger.bind(
+                service="Commands",
+                error_type=type(e).__name__,
+                error_message=str(e),
+            ).warning("Failed to store bot commands hash")
@@ -0,0 +1,48 @@
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+from aiogram import BaseMiddleware
+from aiogram.types import Message, TelegramObject
+
+
+class BatchStatusMiddleware(BaseMiddleware):
+    def __init__(
+        self,
+        payloads: Mapping[str, Callable[[], str]],
+        window: float = 0.05,
+    ):
+        super().__init__()
+        self.payloads = dict(payloads)
+        self.window = window
+        self._cache: Dict[str, Tuple[float, str]] = {}
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        command = self._extract_command(event)
+        if command is not None:
+            data["cached_response"] = self._get_payload(command)
+        return await handler(event, data)
+
+    def _get_payload(self, command: str) -> str:
+        # Payload builders are synchronous, so the payload is ready before
+        # any handler awaits its answer and the window starts from here.
+        now = time.monotonic()
+        cached = self._cache.get(command)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        payload = self.payloads[command]()
+        self._cache[command] = (time.monotonic() + self.window, payload)
+        return payload
+
+    def _extract_command(self, event: TelegramObject) -> Optional[str]:
+        if not isinstance(event, Message) or not event.text:
+            return None
+        if not event.text.startswith("/"):
+            return None
+        command = event.text[1:].split(maxsplit=1)[0].split("@", 1)[0]
+        return command if command in self.payloads else None
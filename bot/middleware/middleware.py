@@ -11,23 +11,23 @@ class AuthMiddleware(BaseMiddleware):
     def __init__(self, config: BotConfig):
         super().__init__()
         self.config = config
+        self._allowed: frozenset[int] = frozenset(config.allowed_users)
 
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
-        event: TelegramObject,
+        event: Message,
         data: Dict[str, Any],
     ) -> Any:
-        if isinstance(event, Message):
-            user_id = event.from_user.id if event.from_user else None
+        user_id = getattr(event.from_user, "id", None)
 
-            if user_id and not self.config.is_user_allowed(user_id):
-                logger.warning(
-                    f"Unauthorized access attempt from user {user_id}"
-                )
-                await event.answer("⛔ У вас нет доступа к этому боту.")
-                return
+        if user_id is not None and user_id not in self._allowed:
+            logger.warning(f"Unauthorized access attempt from user {user_id}")
+            await event.answer("⛔ У вас нет доступа к этому боту.")
+            return
 
-            logger.debug(f"Authorized user {user_id} accessed the bot")
+        logger.opt(lazy=True).debug(
+            "Authorized user {} accessed the bot", lambda: user_id
+        )
 
         return await handler(event, data)
@@ -1,6 +1,13 @@
 from .bot_config import BotConfig
+from .parser_state import ParserState
 from .parser_status import ParserStatus
 from .parsing_progress import ParsingProgress
 from .parsing_result import ParsingResult
 
-__all__ = ["BotConfig", "ParsingProgress", "ParserStatus", "ParsingResult"]
+__all__ = [
+    "BotConfig",
+    "ParsingProgress",
+    "ParserState",
+    "ParserStatus",
+    "ParsingResult",
+]
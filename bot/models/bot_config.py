@@ -1,19 +1,28 @@
+from functools import cached_property
+
+from pydantic import ConfigDict
+
 from shared.config.config_model import ConfigModel
 
 
 class BotConfig(ConfigModel):
+    model_config = ConfigDict(ignored_types=(cached_property,))
 
-    @property
+    @cached_property
     def token(self) -> str:
         return self.api.telegram
 
-    @property
-    def allowed_users(self) -> set[int]:
-        return self.api.tg_users
+    @cached_property
+    def allowed_users(self) -> frozenset[int]:
+        return frozenset(self.api.tg_users)
 
     def is_user_allowed(self, user_id: int) -> bool:
         return user_id in self.allowed_users
 
     @classmethod
     def from_config_model(cls, config: ConfigModel) -> "BotConfig":
-        return cls.model_validate(config.model_dump())
+        # /seturl mutates the bot's parser section, so it must not share
+        # nested objects with the module-level config.
+        return cls.model_validate(
+            config.model_copy(deep=True), from_attributes=True
+        )
@@ -0,0 +1,10 @@
+from enum import IntEnum
+
+
+class ParserState(IntEnum):
+    # Парсинг не запущен
+    IDLE = 0
+    # Идет циклический парсинг
+    RUNNING = 1
+    # Парсинг останавливается
+    STOPPING = 2
@@ -1,17 +1,16 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
 
-class ParserStatus(BaseModel):
-    is_running: bool = Field(..., description="Запущен ли парсер")
-    cycle_enabled: bool = Field(
-        ..., description="Включен ли циклический режим"
-    )
-    interval_seconds: int = Field(
-        ..., description="Интервал между циклами в секундах"
-    )
-    max_concurrency: int = Field(
-        ..., description="Максимальное количество одновременных потоков"
-    )
+@dataclass(slots=True)
+class ParserStatus:
+    # Запущен ли парсер
+    is_running: bool
+    # Включен ли циклический режим
+    cycle_enabled: bool
+    # Интервал между циклами в секундах
+    interval_seconds: int
+    # Максимальное количество одновременных потоков
+    max_concurrency: int
 
     @classmethod
     def create_default(cls) -> "ParserStatus":
@@ -1,45 +1,40 @@
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, computed_field
 
+@dataclass(slots=True)
+class ParsingProgress:
+    # Общее количество URL для обработки
+    total_urls: int = 0
+    # Количество обработанных URL
+    processed_urls: int = 0
+    # Количество найденных товаров
+    found_products: int = 0
+    # Время начала парсинга
+    start_time: Optional[datetime] = None
+    # Время последнего обновления (при старте и завершении)
+    last_update: Optional[datetime] = None
+    # Статус парсинга
+    status: str = "idle"
+    # Сообщение об ошибке
+    error_message: Optional[str] = None
+    _start_ns: int = field(default=0, init=False, repr=False)
+    _last_update_ns: int = field(default=0, init=False, repr=False)
 
-class ParsingProgress(BaseModel):
-
-    total_urls: int = Field(
-        default=0, description="Общее количество URL для обработки"
-    )
-    processed_urls: int = Field(
-        default=0, description="Количество обработанных URL"
-    )
-    found_products: int = Field(
-        default=0, description="Количество найденных товаров"
-    )
-    start_time: Optional[datetime] = Field(
-        default=None, description="Время начала парсинга"
-    )
-    last_update: Optional[datetime] = Field(
-        default=None, description="Время последнего обновления"
-    )
-    status: str = Field(default="idle", description="Статус парсинга")
-    error_message: Optional[str] = Field(
-        default=None, description="Сообщение об ошибке"
-    )
-
-    @computed_field
     @property
     def progress_percentage(self) -> float:
         if self.total_urls == 0:
             return 0.0
         return (self.processed_urls / self.total_urls) * 100
 
-    @computed_field
     @property
     def elapsed_time(self) -> float:
-        if not self.start_time:
+        if not self._start_ns:
             return 0.0
-        end_time = self.last_update or datetime.now()
-        return (end_time - self.start_time).total_seconds()
+        end_ns = self._last_update_ns or time.monotonic_ns()
+        return (end_ns - self._start_ns) / 1e9
 
     def update_progress(
         self,
@@ -52,14 +47,16 @@ class ParsingProgress(BaseModel):
         if found_products is not None:
             self.found_products = found_products
 
-        self.last_update = datetime.now()
+        self._last_update_ns = time.monotonic_ns()
 
     def start_tracking(self, total_urls: int) -> None:
         self.total_urls = total_urls
         self.processed_urls = 0
         self.found_products = 0
         self.start_time = datetime.now()
-        self.last_update = datetime.now()
+        self.last_update = self.start_time
+        self._start_ns = time.monotonic_ns()
+        self._last_update_ns = self._start_ns
         self.status = "running"
         self.error_message = None
 
@@ -68,4 +65,5 @@ class ParsingProgress(BaseModel):
     ) -> None:
         self.status = "completed" if success else "error"
         self.error_message = error_message
+        self._last_update_ns = time.monotonic_ns()
         self.last_update = datetime.now()
@@ -1,27 +1,23 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, computed_field
 
+@dataclass(slots=True)
+class ParsingResult:
+    # Успешность выполнения
+    success: bool
+    # Сообщение о результате
+    message: str
+    # Количество найденных товаров
+    products_count: int = 0
+    # Время начала
+    start_time: Optional[datetime] = None
+    # Время завершения
+    end_time: Optional[datetime] = None
+    # Сообщение об ошибке
+    error_message: Optional[str] = None
 
-class ParsingResult(BaseModel):
-
-    success: bool = Field(..., description="Успешность выполнения")
-    message: str = Field(..., description="Сообщение о результате")
-    products_count: int = Field(
-        default=0, description="Количество найденных товаров"
-    )
-    start_time: Optional[datetime] = Field(
-        default=None, description="Время начала"
-    )
-    end_time: Optional[datetime] = Field(
-        default=None, description="Время завершения"
-    )
-    error_message: Optional[str] = Field(
-        default=None, description="Сообщение об ошибке"
-    )
-
-    @computed_field
     @property
     def duration_seconds(self) -> float:
         if not self.start_time or not self.end_time:
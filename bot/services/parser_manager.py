@@ -1,59 +1,181 @@
 import asyncio
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from aiogram import Bot
 from loguru import logger
 
 from bot.models.bot_config import BotConfig
+from bot.models.parser_state import ParserState
 from bot.models.parser_status import ParserStatus
 from bot.services.progress_tracker import ProgressTracker
 from core.models.product_model import ProductModel
 from core.parsers.mobilede_ru_parser import MobileDeRuParser
 from core.services.scheduler_service import SchedulerService
 from shared.exceptions.request_exceptions import OutOfProxiesException
+from shared.utils.proxy_manager import ProxyManager
+from shared.utils.tasks import cancel_and_await
+
+T = TypeVar("T")
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+NOTIFICATION_FLUSH_INTERVAL = 1.0
+PROGRESS_FLUSH_DELAY = 0.5
+BACKGROUND_TASK_LIMIT = 32
+DB_EXECUTOR_WORKERS = 2
+STATUS_CACHE_TTL = 0.2
+ALLOWED_URL_PREFIXES = ("https://mobile.de/ru/", "https://www.mobile.de/ru/")
+
+_MSG_TRACKER_RUNNING = sys.intern(
+    "Парсинг уже запущен. Сначала остановите текущий парсинг командой /stop"
+)
+_MSG_ALREADY = sys.intern("Парсинг уже запущен")
+_MSG_STOPPING = sys.intern("Парсинг останавливается, повторите попытку позже")
+_MSG_NO_LINKS = sys.intern("Парсинг не запущен: список ссылок пуст")
+_MSG_BAD_URL = sys.intern("Парсинг не запущен из-за ошибки в URL")
+_MSG_STARTED = sys.intern("Парсинг запущен")
+_MSG_NO_PROXIES = sys.intern(
+    "Парсинг не запущен из-за отсутствия рабочих прокси"
+)
+_MSG_START_FAILED = sys.intern("Парсинг не запущен из-за ошибки")
+_MSG_STOPPED = sys.intern("Парсинг остановлен")
+
+OUT_OF_PROXIES_TEMPLATE = (
+    "• Ошибка: Не осталось рабочих прокси!\n\n"
+    "• Парсинг остановлен из-за отсутствия рабочих прокси.\n"
+    "• Система автоматически проверяет прокси в начале каждого цикла.\n"
+    "• Необходимо обновить список прокси в конфигурации.\n"
+    "• Проверьте файл: {proxy_file}\n\n"
+    "• После добавления новых прокси в файл, система автоматически их подхватит в следующем цикле\n"
+    "• Или перезапустите парсинг командой /start"
+)
+
+RESULT_TEMPLATE = (
+    "• Парсинг завершен: {cycle}\n"
+    "• Найдено товаров: {found}\n"
+    "• Новых сохранено: {saved}\n"
+    "• Всего товаров в БД: {total:,}\n"
+    "• Рабочие прокси: {wp}/{tp}"
+)
+
+PARSING_ERROR_TEMPLATE = "• Ошибка парсинга: {error}"
 
 
 class ParserManager:
+    __slots__ = (
+        "config",
+        "bot",
+        "scheduler",
+        "current_task",
+        "_state",
+        "progress_tracker",
+        "notification_chat_id",
+        "cycle_count",
+        "scheduler_config",
+        "_out_queue",
+        "_flusher_task",
+        "_loop",
+        "_loop_thread_id",
+        "_pending_progress",
+        "_progress_flush_handle",
+        "_bg_tasks",
+        "_bg_sem",
+        "_cycle_stats",
+        "_db_executor",
+        "_log",
+        "_stop_event",
+        "_status_cache",
+        "_proxy_manager",
+        "_total_proxies_fn",
+    )
+
     def __init__(self, config: BotConfig, bot: Bot):
         self.config = config
         self.bot = bot
         self.scheduler: Optional[SchedulerService] = None
         self.current_task: Optional[asyncio.Task] = None
+        self._state = ParserState.IDLE
         self.progress_tracker: Optional[ProgressTracker] = None
         self.notification_chat_id: Optional[int] = None
         self.cycle_count = 0
 
         self.scheduler_config = config
+        self._out_queue: asyncio.Queue[Tuple[int, str]] = asyncio.Queue()
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._pending_progress: Optional[Tuple[int, int, int]] = None
+        self._progress_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._bg_tasks: set[asyncio.Task] = set()
+        self._bg_sem = asyncio.BoundedSemaphore(BACKGROUND_TASK_LIMIT)
+        self._cycle_stats: Tuple[int, int] = (0, 0)
+        self._db_executor: Optional[ThreadPoolExecutor] = None
+        self._log = logger.bind(service="ParserManager")
+        self._stop_event = asyncio.Event()
+        self._status_cache: Optional[Tuple[float, ParserStatus]] = None
+        self._proxy_manager: Optional[ProxyManager] = None
+        self._total_proxies_fn: Optional[Callable[[], int]] = None
 
     async def initialize(self):
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="db"
+        )
         self.scheduler = SchedulerService(self.scheduler_config)
         await self.scheduler.initialize()
-        logger.bind(service="ParserManager").info("Parser manager initialized")
+        # valid_proxies is reassigned on every refresh, so the manager is
+        # cached rather than the list itself.
+        self._proxy_manager = self.scheduler.parser_service.proxy_manager
+        self._total_proxies_fn = (
+            self._proxy_manager.get_total_proxies_from_file
+        )
+        self._flusher_task = asyncio.create_task(self._flush_loop())
+        self._log.info("Parser manager initialized")
 
     async def start_parsing(
         self, chat_id: int, start_urls: Optional[List[str]] = None
     ):
         try:
             if self.progress_tracker and self.progress_tracker.is_running():
-                return "Парсинг уже запущен. Сначала остановите текущий парсинг командой /stop"
+                return _MSG_TRACKER_RUNNING
 
-            if self.current_task and not self.current_task.done():
-                return "Парсинг уже запущен"
+            if self._state == ParserState.RUNNING:
+                return _MSG_ALREADY
+            if self._state == ParserState.STOPPING:
+                return _MSG_STOPPING
 
             self.notification_chat_id = chat_id
+            self._log = logger.bind(service="ParserManager", chat_id=chat_id)
 
             if start_urls is None:
                 start_urls = self.config.parser.links
 
+            if not start_urls:
+                self._notify(chat_id, "• Ошибка: Нет ссылок для парсинга")
+                return _MSG_NO_LINKS
+
             for url in start_urls:
-                if not url.startswith(
-                    "https://mobile.de/ru/"
-                ) and not url.startswith("https://www.mobile.de/ru/"):
+                if not url.startswith(ALLOWED_URL_PREFIXES):
                     error_msg = f"• Ошибка: Неверный формат URL. Ожидается URL начинающийся с 'https://mobile.de/ru/', получен: {url}"
-                    await self.bot.send_message(chat_id, error_msg)
-                    return "Парсинг не запущен из-за ошибки в URL"
+                    self._notify(chat_id, error_msg)
+                    return _MSG_BAD_URL
 
+            self._stop_event.clear()
             self.progress_tracker = ProgressTracker(self.bot, chat_id)
 
             await self.progress_tracker.start_tracking(len(start_urls))
@@ -61,102 +183,185 @@ class ParserManager:
             def parsing_callback(
                 result_tuple: Tuple[List[ProductModel], int],
             ):
-                asyncio.create_task(
-                    self._handle_parsing_result(chat_id, result_tuple)
-                )
+                if self._stop_event.is_set():
+                    return
+                self._spawn(self._handle_parsing_result(chat_id, result_tuple))
 
             def error_callback(error: Exception):
-                asyncio.create_task(self._handle_parsing_error(chat_id, error))
-
-            def progress_callback(
-                processed_urls: int,
-                found_products: int,
-                total_links_found: int = 0,
-            ):
-                if self.progress_tracker:
-                    asyncio.create_task(
-                        self.progress_tracker.update_progress(
-                            processed_urls, found_products, total_links_found
-                        )
-                    )
+                if self._stop_event.is_set():
+                    return
+                self._spawn(self._handle_parsing_error(chat_id, error))
 
             def cycle_start_callback(cycle_num: int):
+                if self._stop_event.is_set():
+                    return
+                self._spawn(self._refresh_cycle_stats())
                 if self.progress_tracker:
-                    asyncio.create_task(
+                    self._spawn(
                         self.progress_tracker.start_new_cycle(cycle_num)
                     )
 
             if self.scheduler:
+                self._state = ParserState.RUNNING
                 self.current_task = asyncio.create_task(
                     self.scheduler.start_cyclic_parsing(
                         start_urls=start_urls,
                         callback=parsing_callback,
                         error_callback=error_callback,
                         parser_class=MobileDeRuParser,
-                        progress_callback=progress_callback,
+                        progress_callback=self._on_progress,
                         cycle_start_callback=cycle_start_callback,
                     )
                 )
+                self.current_task.add_done_callback(self._on_task_done)
 
-            logger.bind(chat_id=chat_id).info("Parsing started for chat")
-            return "Парсинг запущен"
+            self._status_cache = None
+            self._log.info("Parsing started for chat")
+            return _MSG_STARTED
 
         except OutOfProxiesException as e:
-            error_msg = (
-                f"• Ошибка: Не осталось рабочих прокси!\n\n"
-                f"• Парсинг остановлен из-за отсутствия рабочих прокси.\n"
-                f"• Система автоматически проверяет прокси в начале каждого цикла.\n"
-                f"• Необходимо обновить список прокси в конфигурации.\n"
-                f"• Проверьте файл: {self.config.parser.proxy_file}\n\n"
-                f"• После добавления новых прокси в файл, система автоматически их подхватит в следующем цикле\n"
-                f"• Или перезапустите парсинг командой /start"
+            error_msg = OUT_OF_PROXIES_TEMPLATE.format(
+                proxy_file=self.config.parser.proxy_file
             )
-            await self.bot.send_message(chat_id, error_msg)
-            logger.bind(
-                chat_id=chat_id,
+            self._notify(chat_id, error_msg)
+            self._log.bind(
                 error_type=type(e).__name__,
                 error_message=str(e),
             ).error("No working proxies available for chat")
-            return "Парсинг не запущен из-за отсутствия рабочих прокси"
+            return _MSG_NO_PROXIES
         except Exception as e:
             error_msg = f"• Ошибка при запуске парсинга: {str(e)}"
-            await self.bot.send_message(chat_id, error_msg)
-            logger.bind(
-                chat_id=chat_id,
+            self._notify(chat_id, error_msg)
+            self._log.bind(
                 error_type=type(e).__name__,
                 error_message=str(e),
             ).error("Failed to start parsing for chat")
-            return "Парсинг не запущен из-за ошибки"
+            return _MSG_START_FAILED
+
+    def _on_progress(
+        self,
+        processed_urls: int,
+        found_products: int,
+        total_links_found: int = 0,
+    ):
+        self._call_soon(
+            self._queue_progress_update,
+            processed_urls,
+            found_products,
+            total_links_found,
+        )
+
+    def _queue_progress_update(
+        self,
+        processed_urls: int,
+        found_products: int,
+        total_links_found: int,
+    ):
+        if self._stop_event.is_set():
+            return
+        self._pending_progress = (
+            processed_urls,
+            found_products,
+            total_links_found,
+        )
+        if self._progress_flush_handle is None and self._loop:
+            self._progress_flush_handle = self._loop.call_later(
+                PROGRESS_FLUSH_DELAY, self._flush_progress
+            )
+
+    def _flush_progress(self):
+        self._progress_flush_handle = None
+        pending = self._pending_progress
+        self._pending_progress = None
+        if pending and self.progress_tracker:
+            self.progress_tracker.record(*pending)
+
+    def _cancel_progress_flush(self):
+        if self._progress_flush_handle:
+            self._progress_flush_handle.cancel()
+            self._progress_flush_handle = None
+        self._pending_progress = None
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> None:
+        task = asyncio.create_task(self._run_bounded(coro))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+
+    async def _run_bounded(self, coro: Coroutine[Any, Any, Any]):
+        try:
+            async with self._bg_sem:
+                await coro
+        finally:
+            coro.close()
+
+    def _call_soon(self, callback, *args) -> None:
+        if self._loop is None:
+            return
+        if threading.get_ident() == self._loop_thread_id:
+            self._loop.call_soon(callback, *args)
+        else:
+            self._loop.call_soon_threadsafe(callback, *args)
+
+    def _on_task_done(self, task: asyncio.Task):
+        # Only a run that ended on its own goes idle here; a stopping run
+        # is reset by stop_parsing once its shutdown steps have finished.
+        if (
+            task is self.current_task
+            and self._state == ParserState.RUNNING
+        ):
+            self._state = ParserState.IDLE
 
     async def stop_parsing(self):
-        if self.current_task and not self.current_task.done():
-            self.current_task.cancel()
-            try:
-                await self.current_task
-            except asyncio.CancelledError:
-                pass
+        owns_stop = self._state != ParserState.STOPPING
+        if owns_stop:
+            self._state = ParserState.STOPPING
+        self._stop_event.set()
+        self._cancel_progress_flush()
 
+        shutdown_steps = [self._cancel_current_task()]
         if self.progress_tracker:
-            await self.progress_tracker.stop_tracking()
-
+            shutdown_steps.append(self.progress_tracker.stop_tracking())
         if self.scheduler:
-            await self.scheduler.stop()
+            shutdown_steps.append(self.scheduler.stop())
+
+        results = await asyncio.gather(*shutdown_steps, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self._log.bind(
+                    error_type=type(result).__name__,
+                    error_message=str(result),
+                ).warning("Error while stopping parsing")
 
         self.cycle_count = 0
+        if owns_stop and self._state == ParserState.STOPPING:
+            self._state = ParserState.IDLE
+        self._status_cache = None
+
+        self._log.info("Parsing stopped")
+        return _MSG_STOPPED
 
-        logger.bind(service="ParserManager").info("Parsing stopped")
-        return "Парсинг остановлен"
+    async def _cancel_current_task(self):
+        await cancel_and_await((self.current_task,))
 
     def get_status(self) -> ParserStatus:
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached and now - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+
         if self.scheduler:
             status_dict = self.scheduler.get_status()
-            return ParserStatus(
+            status = ParserStatus(
                 is_running=bool(status_dict["is_running"]),
                 cycle_enabled=bool(status_dict["cycle_enabled"]),
                 interval_seconds=int(status_dict["interval_seconds"]),
                 max_concurrency=int(status_dict["max_concurrency"]),
             )
-        return ParserStatus.create_default()
+        else:
+            status = ParserStatus.create_default()
+
+        self._status_cache = (now, status)
+        return status
 
     async def _handle_parsing_result(
         self,
@@ -165,136 +370,220 @@ class ParserManager:
     ):
         products, saved_count = result_tuple
         self.cycle_count += 1
+        self._cancel_progress_flush()
 
         try:
             if not products:
-                await self.bot.send_message(
-                    chat_id, "• Парсинг завершен, но результаты не найдены"
+                summary = "• Парсинг завершен, но результаты не найдены"
+            else:
+                cycle_products_in_db, total_proxies = self._cycle_stats
+                total_products_in_db = cycle_products_in_db + saved_count
+                summary = RESULT_TEMPLATE.format_map(
+                    {
+                        "cycle": self.cycle_count,
+                        "found": len(products),
+                        "saved": saved_count,
+                        "total": total_products_in_db,
+                        "wp": self._count_working_proxies(),
+                        "tp": total_proxies,
+                    }
                 )
+                self._log.bind(
+                    products_count=len(products),
+                    cycle_count=self.cycle_count,
+                ).info("Parsing completed for chat")
 
-                if self.progress_tracker:
-                    await self.progress_tracker.update_progress(
-                        processed_urls=self.progress_tracker.total_links_found,
-                        found_products=0,
-                        total_links_found=self.progress_tracker.total_links_found,
-                    )
-                    await self.progress_tracker.complete_tracking(success=True)
-                return
-
-            db_stats = self.get_database_stats()
-            total_products_in_db = (
-                db_stats.get("total_products", 0)
-                if "error" not in db_stats
-                else 0
-            )
-
-            working_proxies_count = self._get_working_proxies_count()
-
-            await self.bot.send_message(
-                chat_id,
-                f"• Парсинг завершен: {self.cycle_count}\n"
-                f"• Найдено товаров: {len(products)}\n"
-                f"• Новых сохранено: {saved_count}\n"
-                f"• Всего товаров в БД: {total_products_in_db:,}\n"
-                f"• Рабочие прокси: {working_proxies_count[0]}/{working_proxies_count[1]}",
-            )
-            logger.bind(
-                chat_id=chat_id,
-                products_count=len(products),
-                cycle_count=self.cycle_count,
-            ).info("Parsing completed for chat")
-
-            if self.progress_tracker:
-                await self.progress_tracker.update_progress(
-                    processed_urls=self.progress_tracker.total_links_found,
-                    found_products=len(products),
-                    total_links_found=self.progress_tracker.total_links_found,
-                )
-                await self.progress_tracker.complete_tracking(success=True)
+            await self._finish_cycle(chat_id, len(products), summary)
 
         except Exception as e:
-            logger.bind(
-                chat_id=chat_id,
+            self._log.bind(
                 error_type=type(e).__name__,
                 error_message=str(e),
             ).error("Failed to send results")
-            await self.bot.send_message(
+            self._notify(
                 chat_id, f"• Ошибка при отправке результатов: {str(e)}"
             )
 
+    async def _finish_cycle(
+        self, chat_id: int, found_products: int, summary: str
+    ):
+        tracker = self.progress_tracker
+        if not tracker:
+            self._notify(chat_id, summary)
+            return
+
+        tracker.record(
+            processed_urls=tracker.total_links_found,
+            found_products=found_products,
+            total_links_found=tracker.total_links_found,
+        )
+        delivered = await tracker.complete_tracking(
+            success=True, final_message=summary
+        )
+        if not delivered:
+            # The final edit failed, so send the summary as its own message.
+            self._notify(chat_id, summary)
+
     async def _handle_parsing_error(
         self,
         chat_id: int,
         error: Exception,
     ):
+        self._cancel_progress_flush()
+
         if self.progress_tracker:
             await self.progress_tracker.complete_tracking(
                 success=False, error_message=f"Ошибка парсинга: {str(error)}"
             )
 
         if isinstance(error, OutOfProxiesException):
-            error_msg = (
-                f"• Ошибка: Не осталось рабочих прокси!\n\n"
-                f"• Парсинг остановлен из-за отсутствия рабочих прокси.\n"
-                f"• Система автоматически проверяет прокси в начале каждого цикла.\n"
-                f"• Необходимо обновить список прокси в конфигурации.\n"
-                f"• Проверьте файл: {self.config.parser.proxy_file}\n\n"
-                f"• После добавления новых прокси в файл, система автоматически их подхватит в следующем цикле\n"
-                f"• Или перезапустите парсинг командой /start"
+            error_msg = OUT_OF_PROXIES_TEMPLATE.format(
+                proxy_file=self.config.parser.proxy_file
             )
         else:
-            error_msg = f"• Ошибка парсинга: {str(error)}"
+            error_msg = PARSING_ERROR_TEMPLATE.format_map({"error": error})
 
-        await self.bot.send_message(chat_id, error_msg)
-        logger.bind(
-            chat_id=chat_id,
+        self._notify(chat_id, error_msg)
+        self._log.bind(
             error_type=type(error).__name__,
             error_message=str(error),
         ).error("Parsing error occurred for chat")
 
     async def close(self):
         await self.stop_parsing()
-        logger.bind(service="ParserManager").info("Parser manager closed")
 
-    def get_database_stats(self) -> dict:
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
+        await cancel_and_await((self._flusher_task,))
+
+        if self._db_executor:
+            self._db_executor.shutdown(wait=False, cancel_futures=True)
+
+        self._log.info("Parser manager closed")
+
+    def _notify(self, chat_id: int, text: str) -> None:
+        self._out_queue.put_nowait((chat_id, text))
+
+    async def _flush_loop(self):
+        pending: Dict[int, List[str]] = defaultdict(list)
+        try:
+            while True:
+                chat_id, text = await self._out_queue.get()
+                pending[chat_id].append(text)
+                await asyncio.sleep(NOTIFICATION_FLUSH_INTERVAL)
+                self._drain_notifications(pending)
+                await self._send_notifications(pending)
+        except asyncio.CancelledError:
+            self._drain_notifications(pending)
+            await self._send_notifications(pending)
+            raise
+
+    def _drain_notifications(self, pending: Dict[int, List[str]]) -> None:
+        while not self._out_queue.empty():
+            chat_id, text = self._out_queue.get_nowait()
+            pending[chat_id].append(text)
+
+    async def _send_notifications(self, pending: Dict[int, List[str]]):
+        while pending:
+            chat_id = next(iter(pending))
+            # Batches stay in pending until sent, so a cancellation during
+            # send_message leaves them for the final flush.
+            batches = self._pack_notifications(pending[chat_id])
+            pending[chat_id] = batches
+            while batches:
+                try:
+                    await self.bot.send_message(chat_id, batches[0])
+                except Exception as e:
+                    self._log.bind(
+                        chat_id=chat_id,
+                        error_type=type(e).__name__,
+                        error_message=str(e),
+                    ).error("Failed to send notification")
+                del batches[0]
+            del pending[chat_id]
+
+    @staticmethod
+    def _pack_notifications(texts: List[str]) -> List[str]:
+        batches: List[str] = []
+        current = ""
+        for text in texts:
+            candidate = f"{current}\n\n{text}" if current else text
+            if current and len(candidate) > TELEGRAM_MESSAGE_LIMIT:
+                batches.append(current)
+                current = text
+            else:
+                current = candidate
+        if current:
+            batches.append(current)
+        return batches
+
+    async def get_database_stats(self) -> dict:
+        return await self._run_in_db_executor(self._get_database_stats)
+
+    async def create_sql_dump(self, output_path: str) -> bool:
+        return await self._run_in_db_executor(
+            self._create_sql_dump, output_path
+        )
+
+    async def export_from_database(self) -> Optional[Tuple[List[Path], int]]:
+        return await self._run_in_db_executor(self._export_from_database)
+
+    async def clear_database(self) -> bool:
+        return await self._run_in_db_executor(self._clear_database)
+
+    async def _run_in_db_executor(self, func: Callable[..., T], *args) -> T:
+        loop = self._loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, func, *args)
+
+    def _get_database_stats(self) -> dict:
         if self.scheduler and self.scheduler.parser_service:
             return self.scheduler.parser_service.get_database_stats()
         return {"error": "Parser service not available"}
 
-    def create_sql_dump(self, output_path: str) -> bool:
+    def _create_sql_dump(self, output_path: str) -> bool:
         if self.scheduler and self.scheduler.parser_service:
             return self.scheduler.parser_service.create_sql_dump(output_path)
         return False
 
-    async def export_from_database(self) -> Optional[Tuple[List[Path], int]]:
+    def _export_from_database(self) -> Optional[Tuple[List[Path], int]]:
         if self.scheduler and self.scheduler.parser_service:
-            return await self.scheduler.parser_service.export_from_database()
+            return self.scheduler.parser_service.export_from_database()
         return None
 
-    def clear_database(self) -> bool:
+    def _clear_database(self) -> bool:
         try:
             if self.scheduler and self.scheduler.parser_service:
                 return self.scheduler.parser_service.database_service.clear_database()
             return False
         except Exception as e:
-            logger.bind(
-                service="ParserManager",
+            self._log.bind(
                 error_type=type(e).__name__,
                 error_message=str(e),
             ).error("Failed to clear database")
             return False
 
+    async def _refresh_cycle_stats(self):
+        self._cycle_stats = await self._run_in_db_executor(
+            self._collect_cycle_stats
+        )
+
+    def _collect_cycle_stats(self) -> Tuple[int, int]:
+        db_stats = self._get_database_stats()
+        total_products_in_db = (
+            db_stats.get("total_products", 0) if "error" not in db_stats else 0
+        )
+        return total_products_in_db, self._get_working_proxies_count()[1]
+
+    def _count_working_proxies(self) -> int:
+        if self._proxy_manager is None:
+            return 0
+        return len(self._proxy_manager.valid_proxies)
+
     def _get_working_proxies_count(self) -> tuple[int, int]:
-        try:
-            if self.scheduler and self.scheduler.parser_service:
-                proxy_manager = self.scheduler.parser_service.proxy_manager
-                working_count = (
-                    len(proxy_manager.valid_proxies)
-                    if hasattr(proxy_manager, "valid_proxies")
-                    else 0
-                )
-                total_count = proxy_manager.get_total_proxies_from_file()
-                return working_count, total_count
+        if self._proxy_manager is None or self._total_proxies_fn is None:
             return 0, 0
+        try:
+            return self._count_working_proxies(), self._total_proxies_fn()
         except Exception:
             return 0, 0
@@ -6,19 +6,49 @@ from loguru import logger
 
 from bot.models.parsing_progress import ParsingProgress
 
+_HEADER = "<b>Парсинг Mobile.de</b>\n\n"
+
+_STATUS_TEXT = {
+    "idle": "Ожидание",
+    "running": "Выполняется",
+    "completed": "Завершено",
+    "error": "Ошибка",
+}
+
 
 class ProgressTracker:
+    __slots__ = (
+        "bot",
+        "chat_id",
+        "progress",
+        "progress_message_id",
+        "update_interval",
+        "_min_edit_interval",
+        "_last_send",
+        "_delayed_send_task",
+        "total_links_found",
+        "cycle_count",
+        "_last_fingerprint",
+        "_send_lock",
+        "_is_running",
+        "_log",
+    )
+
     def __init__(self, bot: Bot, chat_id: int):
         self.bot = bot
         self.chat_id = chat_id
         self.progress = ParsingProgress()
         self.progress_message_id: Optional[int] = None
         self.update_interval = 10
-        self._update_task: Optional[asyncio.Task] = None
+        self._min_edit_interval = float(self.update_interval)
+        self._last_send = 0.0
+        self._delayed_send_task: Optional[asyncio.Task] = None
         self.total_links_found = 0
         self.cycle_count = 0
-        self.last_message_text: Optional[str] = None
+        self._last_fingerprint: tuple = ()
+        self._send_lock = asyncio.Lock()
         self._is_running = False
+        self._log = logger.bind(service="ProgressTracker", chat_id=chat_id)
 
     async def start_tracking(self, total_start_urls: int):
         if self._is_running:
@@ -31,15 +61,11 @@ class ProgressTracker:
         self.progress.start_tracking(total_start_urls)
         self.total_links_found = 0
         self.cycle_count = 0
-        self.last_message_text = None
+        self._last_fingerprint = ()
 
-        self._update_task = asyncio.create_task(self._periodic_update())
-
-        logger.bind(
-            service="ProgressTracker",
-            total_start_urls=total_start_urls,
-            chat_id=self.chat_id,
-        ).info("Progress tracking started")
+        self._log.bind(total_start_urls=total_start_urls).info(
+            "Progress tracking started"
+        )
 
     async def start_new_cycle(self, cycle_number: int):
         self.cycle_count = cycle_number
@@ -48,169 +74,216 @@ class ProgressTracker:
 
         self.total_links_found = 0
 
-        self.last_message_text = None
-
-        if self._update_task and not self._update_task.done():
-            self._update_task.cancel()
-            try:
-                await self._update_task
-            except asyncio.CancelledError:
-                pass
-
-        self._update_task = asyncio.create_task(self._periodic_update())
+        self._last_fingerprint = ()
 
         await self._send_progress_message()
 
-        logger.bind(
-            service="ProgressTracker",
-            cycle_number=cycle_number,
-            chat_id=self.chat_id,
-        ).info(
-            "New cycle started, progress reset and periodic update restarted"
+        self._log.bind(cycle_number=cycle_number).info(
+            "New cycle started, progress reset"
         )
 
-    async def update_progress(
+    def record(
         self,
         processed_urls: Optional[int] = None,
         found_products: Optional[int] = None,
         total_links_found: Optional[int] = None,
-    ):
+    ) -> None:
+        if (
+            processed_urls is None
+            and found_products is None
+            and total_links_found is None
+        ):
+            return
+
+        progress = self.progress
+        before = (
+            self.total_links_found,
+            progress.total_urls,
+            progress.processed_urls,
+            progress.found_products,
+        )
+
         if total_links_found is not None:
             self.total_links_found = total_links_found
             if total_links_found > 0:
-                self.progress.total_urls = total_links_found
+                progress.total_urls = total_links_found
                 if processed_urls is None:
                     processed_urls = total_links_found
 
-        self.progress.update_progress(processed_urls, found_products)
+        progress.update_progress(processed_urls, found_products)
+
+        if before != (
+            self.total_links_found,
+            progress.total_urls,
+            progress.processed_urls,
+            progress.found_products,
+        ):
+            self._schedule_send()
 
     async def complete_tracking(
-        self, success: bool = True, error_message: Optional[str] = None
-    ):
+        self,
+        success: bool = True,
+        error_message: Optional[str] = None,
+        final_message: Optional[str] = None,
+    ) -> bool:
         self.progress.complete_tracking(success, error_message)
+        self._cancel_delayed_send()
 
-        if self._update_task and not self._update_task.done():
-            self._update_task.cancel()
-            try:
-                await self._update_task
-            except asyncio.CancelledError:
-                pass
-
-        await self._send_progress_message(final=True)
+        delivered = await self._send_progress_message(
+            final=True, extra_text=final_message
+        )
 
-        logger.bind(
-            service="ProgressTracker",
-            chat_id=self.chat_id,
+        self._log.bind(
             success=success,
             error_message=error_message,
         ).info("Progress tracking completed")
+        return delivered
 
     async def stop_tracking(self):
         if not self._is_running:
             return
 
         self._is_running = False
-
-        if self._update_task and not self._update_task.done():
-            self._update_task.cancel()
-            try:
-                await self._update_task
-            except asyncio.CancelledError:
-                pass
+        self._cancel_delayed_send()
 
         self.progress.status = "error"
         self.progress.error_message = "Парсинг остановлен пользователем"
 
         await self._send_progress_message(final=True)
 
-        logger.bind(
-            service="ProgressTracker",
-            chat_id=self.chat_id,
-        ).info("Progress tracking stopped by user")
+        self._log.info("Progress tracking stopped by user")
 
     def is_running(self) -> bool:
         return self._is_running
 
-    async def _send_progress_message(self, final: bool = False):
-        message_text = self._format_progress_message(final)
+    async def _send_progress_message(
+        self, final: bool = False, extra_text: Optional[str] = None
+    ) -> bool:
+        async with self._send_lock:
+            progress = self.progress
+            fingerprint = (
+                self.cycle_count,
+                progress.status,
+                progress.processed_urls,
+                progress.total_urls,
+                progress.found_products,
+                self.total_links_found,
+                progress.error_message,
+            )
+            if (
+                not final
+                and self.progress_message_id
+                and fingerprint == self._last_fingerprint
+            ):
+                return True
+
+            if final or not self.progress_message_id:
+                message_text = self._format_initial()
+            else:
+                message_text = self._format_update()
+            if extra_text:
+                message_text = f"{message_text}\n\n{extra_text}"
 
-        try:
-            if self.progress_message_id:
-                if not final and message_text == self.last_message_text:
-                    return
+            try:
+                self._last_send = asyncio.get_running_loop().time()
+                if self.progress_message_id:
+                    await self.bot.edit_message_text(
+                        chat_id=self.chat_id,
+                        message_id=self.progress_message_id,
+                        text=message_text,
+                    )
+                    self._last_fingerprint = fingerprint
+
+                    if final:
+                        self.progress_message_id = None
+                else:
+                    message = await self.bot.send_message(
+                        chat_id=self.chat_id, text=message_text
+                    )
+                    if not final:
+                        self.progress_message_id = message.message_id
+                        self._last_fingerprint = fingerprint
+                return True
 
-                await self.bot.edit_message_text(
-                    chat_id=self.chat_id,
-                    message_id=self.progress_message_id,
-                    text=message_text,
-                )
-                self.last_message_text = message_text
+            except Exception as e:
+                self._log.bind(
+                    error_type=type(e).__name__,
+                    error_message=str(e),
+                ).error("Failed to send progress message")
+                return False
 
-                if final:
-                    self.progress_message_id = None
-            else:
-                message = await self.bot.send_message(
-                    chat_id=self.chat_id, text=message_text
-                )
-                if not final:
-                    self.progress_message_id = message.message_id
-                    self.last_message_text = message_text
-
-        except Exception as e:
-            logger.bind(
-                service="ProgressTracker",
-                chat_id=self.chat_id,
-                error_type=type(e).__name__,
-                error_message=str(e),
-            ).error("Failed to send progress message")
-
-    def _format_progress_message(self, final: bool = False) -> str:
-        status_text = {
-            "idle": "Ожидание",
-            "running": "Выполняется",
-            "completed": "Завершено",
-            "error": "Ошибка",
-        }
-
-        message = "<b>Парсинг Mobile.de</b>\n\n"
+    def _format_initial(self) -> str:
+        progress = self.progress
+        parts = [_HEADER]
 
         if self.cycle_count > 0:
-            message += f"• Цикл: #{self.cycle_count}\n"
+            parts.append(f"• Цикл: #{self.cycle_count}\n")
 
-        message += f"• Статус: {status_text[self.progress.status]}\n"
+        parts.append(f"• Статус: {_STATUS_TEXT[progress.status]}\n")
 
-        if self.progress.total_urls > 0:
-            message += f"• Прогресс: {self.progress.processed_urls}/{self.progress.total_urls} "
-            message += f"({self.progress.progress_percentage:.1f}%)\n"
+        if progress.total_urls > 0:
+            parts.append(
+                f"• Прогресс: {progress.processed_urls}/{progress.total_urls} "
+                f"({progress.progress_percentage:.1f}%)\n"
+            )
 
         if self.total_links_found > 0:
-            message += f"• Найдено ссылок: {self.total_links_found}\n"
-        message += f"• Найдено товаров: {self.progress.found_products}\n"
+            parts.append(f"• Найдено ссылок: {self.total_links_found}\n")
+        parts.append(f"• Найдено товаров: {progress.found_products}\n")
 
-        if self.progress.elapsed_time > 0:
-            elapsed_minutes = int(self.progress.elapsed_time // 60)
-            elapsed_seconds = int(self.progress.elapsed_time % 60)
-            message += (
+        elapsed_time = progress.elapsed_time
+        if elapsed_time > 0:
+            elapsed_minutes, elapsed_seconds = divmod(int(elapsed_time), 60)
+            parts.append(
                 f"• Время цикла: {elapsed_minutes:02d}:{elapsed_seconds:02d}\n"
             )
 
-        if self.progress.error_message:
-            message += f"\n• Ошибка: {self.progress.error_message}"
+        if progress.error_message:
+            parts.append(f"\n• Ошибка: {progress.error_message}")
 
-        return message
+        return "".join(parts)
 
-    async def _periodic_update(self):
-        while self.progress.status == "running":
-            try:
-                await asyncio.sleep(self.update_interval)
-                await self._send_progress_message()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.bind(
-                    service="ProgressTracker",
-                    chat_id=self.chat_id,
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                ).error("Error in periodic update")
-                break
+    def _format_update(self) -> str:
+        progress = self.progress
+        parts = ["▶ "]
+
+        if self.cycle_count > 0:
+            parts.append(f"#{self.cycle_count} · ")
+
+        if progress.total_urls > 0:
+            parts.append(
+                f"{progress.processed_urls}/{progress.total_urls} "
+                f"({progress.progress_percentage:.1f}%) · "
+            )
+
+        parts.append(f"товаров: {progress.found_products}")
+
+        elapsed_time = progress.elapsed_time
+        if elapsed_time > 0:
+            elapsed_minutes, elapsed_seconds = divmod(int(elapsed_time), 60)
+            parts.append(f" · {elapsed_minutes:02d}:{elapsed_seconds:02d}")
+
+        return "".join(parts)
+
+    def _schedule_send(self):
+        task = self._delayed_send_task
+        if task is not None and not task.done():
+            return
+
+        loop = asyncio.get_running_loop()
+        delay = self._last_send + self._min_edit_interval - loop.time()
+        self._delayed_send_task = loop.create_task(
+            self._delayed_send(max(delay, 0.0))
+        )
+
+    def _cancel_delayed_send(self):
+        if self._delayed_send_task is not None:
+            self._delayed_send_task.cancel()
+            self._delayed_send_task = None
+
+    async def _delayed_send(self, delay: float):
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.progress.status != "running":
+            return
+        await self._send_progress_message()
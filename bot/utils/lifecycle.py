@@ -6,6 +6,9 @@ from loguru import logger
 
 from bot.bot import TelegramBot
 from bot.models.bot_config import BotConfig
+from shared.utils.tasks import cancel_and_await
+
+SHUTDOWN_TIMEOUT = 10
 
 
 class BotLifecycle:
@@ -40,32 +43,48 @@ class BotLifecycle:
 
         self._shutdown_event.set()
 
-        for task in self._tasks:
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        try:
+            await asyncio.wait_for(self._shutdown(), SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.bind(timeout=SHUTDOWN_TIMEOUT).warning(
+                "Shutdown timed out, cancelling pending tasks"
+            )
+            await cancel_and_await(self._tasks)
+
+        logger.info("Bot lifecycle stopped")
 
+    async def _shutdown(self):
+        # Reaping the polling task closes the bot session. Doing it first
+        # means no shutdown request is in flight at that point; aiogram
+        # reopens the session for the requests bot.stop() sends.
+        await cancel_and_await(self._tasks)
         if self.bot:
             await self.bot.stop()
 
-        logger.info("Bot lifecycle stopped")
-
     async def wait_for_shutdown(self):
         await self._shutdown_event.wait()
 
     def _setup_signal_handlers(self):
-        def signal_handler(signum, frame):
+        loop = asyncio.get_running_loop()
+
+        def on_signal(signum: int):
             if not self._shutdown_in_progress:
                 logger.info(
                     f"Received signal {signum}, initiating shutdown..."
                 )
-                asyncio.create_task(self.stop())
-
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+                loop.create_task(self.stop())
+
+        try:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, on_signal, sig)
+        except NotImplementedError:
+            # Windows event loops do not support add_signal_handler. The
+            # handler may run outside the loop, so it only hands off.
+            def signal_handler(signum, frame):
+                loop.call_soon_threadsafe(on_signal, signum)
+
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
 
     async def __aenter__(self):
         await self.start()
@@ -1,10 +1,28 @@
+from functools import cached_property
 from typing import Dict, List, Optional
 
 from loguru import logger
 from pydantic import BaseModel, Field, computed_field
 
-from shared.config.config_model import ConfigModel
+from shared.config.config_model import ConfigModel, ImageExclusionRule
 from shared.exceptions.model_exceptions import ModelExclusionError
+from shared.services.logger import is_level_enabled
+
+_MISSING = object()
+
+_SPACE_TRANS = str.maketrans(",", " ")
+
+_REQUIRED_STR_FIELDS = (
+    "category",
+    "model",
+    "color",
+    "year_of_release",
+    "mileage",
+    "transmission",
+    "fuel",
+    "body",
+    "price",
+)
 
 
 class ProductModel(BaseModel):
@@ -36,57 +54,76 @@ class ProductModel(BaseModel):
 
     class Config:
         validate_by_name = True
-        validate_assignment = True
+        frozen = True
         populate_by_field_name = True
+        ignored_types = (cached_property,)
 
     def __init__(self, config: ConfigModel, **data):
         data["config"] = config
         super().__init__(**data)
 
+    @cached_property
+    def dealer_lc(self) -> str:
+        return self.dealer.lower()
+
+    @cached_property
+    def category_lc(self) -> str:
+        return self.category.lower()
+
     @computed_field
-    @property
+    @cached_property
     def processed_model(self) -> str:
         return self.apply_text_replacements_to_string(self.model)
 
     @computed_field
-    @property
+    @cached_property
     def processed_door_count(self) -> str:
         return self.apply_text_replacements_to_string(self.door_count)
 
     @computed_field
-    @property
+    @cached_property
     def processed_transmission(self) -> str:
         return self.apply_text_replacements_to_string(self.transmission)
 
     @computed_field
-    @property
+    @cached_property
     def processed_fuel(self) -> str:
         return self.apply_text_replacements_to_string(self.fuel)
 
     @computed_field
-    @property
+    @cached_property
     def processed_body(self) -> str:
         return self.apply_text_replacements_to_string(self.body)
 
     @computed_field
-    @property
+    @cached_property
     def processed_color(self) -> str:
         return self.apply_text_replacements_to_string(self.color)
 
+    @cached_property
+    def template_values(self) -> Dict[str, str]:
+        # Shared by the title and SEO templates, resolved once per product.
+        return {
+            "category": self.category,
+            "model": self.processed_model,
+            "year": self.year_of_release,
+            "mileage": self.mileage,
+            "transmission": self.processed_transmission,
+            "fuel": self.processed_fuel or "",
+            "price": self.price or "",
+        }
+
     @computed_field
-    @property
+    @cached_property
     def formatted_title(self) -> str:
         try:
-            formatted = self.config.templates.title.format(
-                category=self.category,
-                model=self.processed_model,
-                year=self.year_of_release,
-                mileage=self.mileage,
-                transmission=self.processed_transmission,
+            formatted = self.config.templates.title.format_map(
+                self.template_values
             ).strip()
-            logger.bind(formatted_title=formatted).debug(
-                "Title formatted successfully"
-            )
+            if is_level_enabled("DEBUG"):
+                logger.bind(formatted_title=formatted).debug(
+                    "Title formatted successfully"
+                )
             return formatted
         except (KeyError, ValueError) as e:
             fallback = f"{self.category} {self.processed_model}, {self.year_of_release}".strip()
@@ -98,29 +135,26 @@ class ProductModel(BaseModel):
             return fallback
 
     @computed_field
-    @property
+    @cached_property
     def formatted_tab_one(self) -> str:
         return self.config.templates.tabs_one + self.processed_text
 
     @computed_field
-    @property
+    @cached_property
     def formatted_tab_two(self) -> str:
         return self.config.templates.tabs_two
 
     @computed_field
-    @property
+    @cached_property
     def formatted_seo_title(self) -> str:
         try:
-            formatted = self.config.templates.seo_title.format(
-                category=self.category,
-                model=self.processed_model,
-                year=self.year_of_release,
-                fuel=self.processed_fuel or "",
-                price=self.price or "",
+            formatted = self.config.templates.seo_title.format_map(
+                self.template_values
             ).strip()
-            logger.bind(formatted_seo_title=formatted).debug(
-                "SEO title formatted successfully"
-            )
+            if is_level_enabled("DEBUG"):
+                logger.bind(formatted_seo_title=formatted).debug(
+                    "SEO title formatted successfully"
+                )
             return formatted
         except (KeyError, ValueError) as e:
             fallback = f"{self.category} {self.processed_model}, {self.year_of_release} год. {self.processed_fuel}, цена {self.price} € — авто под заказ из Европы"
@@ -132,18 +166,16 @@ class ProductModel(BaseModel):
             return fallback
 
     @computed_field
-    @property
+    @cached_property
     def formatted_seo_description(self) -> str:
         try:
-            formatted = self.config.templates.seo_description.format(
-                category=self.category,
-                model=self.processed_model,
-                year=self.year_of_release,
-                price=self.price or "",
+            formatted = self.config.templates.seo_description.format_map(
+                self.template_values
             ).strip()
-            logger.bind(formatted_seo_description=formatted).debug(
-                "SEO description formatted successfully"
-            )
+            if is_level_enabled("DEBUG"):
+                logger.bind(formatted_seo_description=formatted).debug(
+                    "SEO description formatted successfully"
+                )
             return formatted
         except (KeyError, ValueError) as e:
             fallback = f"Купить авто из Европы под заказ {self.category} {self.processed_model}, {self.year_of_release} за {self.price}€. Прозрачная история. Реальный пробег."
@@ -155,39 +187,39 @@ class ProductModel(BaseModel):
             return fallback
 
     @computed_field
-    @property
+    @cached_property
     def formatted_seo_keywords(self) -> str:
-        brand_specific = f"авто из {self.category.lower()}, купить авто под заказ из {self.category.lower()}"
+        category_lc = self.category_lc
+        brand_specific = f"авто из {category_lc}, купить авто под заказ из {category_lc}"
         formatted = (
             f"{self.config.templates.seo_keywords}, {brand_specific}".strip()
         )
-        logger.bind(formatted_seo_keywords=formatted).debug(
-            "SEO keywords formatted successfully"
-        )
+        if is_level_enabled("DEBUG"):
+            logger.bind(formatted_seo_keywords=formatted).debug(
+                "SEO keywords formatted successfully"
+            )
         return formatted
 
     @computed_field
-    @property
+    @cached_property
     def processed_text(self) -> str:
         processed = self.apply_text_replacements_to_text_field(self.text)
-        logger.bind(
-            original_length=len(self.text),
-            processed_length=len(processed),
-            final_length=len(processed),
-        ).debug("Text processed successfully")
+        if is_level_enabled("DEBUG"):
+            logger.bind(
+                original_length=len(self.text),
+                processed_length=len(processed),
+                final_length=len(processed),
+            ).debug("Text processed successfully")
         return processed
 
     @computed_field
-    @property
+    @cached_property
     def processed_images_string(self) -> str:
-        return (
-            ",".join(self.get_processed_images())
-            if self.get_processed_images()
-            else ""
-        )
+        images = self.processed_images
+        return ",".join(images) if images else ""
 
     @computed_field
-    @property
+    @cached_property
     def proccessed_start_text(self) -> str:
         formatted_string = self.config.templates.start_text.format(
             category=self.category, model=self.processed_model
@@ -197,81 +229,76 @@ class ProductModel(BaseModel):
     def apply_text_replacements_to_text_field(self, text: List[str]) -> str:
         if not text:
             return ""
-        replacements = self.config.data.replacement_rules
-        if not replacements:
-            logger.bind(text_length=len(text)).debug(
-                "No replacement rules available"
-            )
-            return "<br />".join(text)
-        result = text
-        replacements_made = 0
-        for original, replacement in replacements.items():
-            if original in result:
-                result = [
-                    item.replace(original, replacement) for item in result
-                ]
-                replacements_made += 1
-        logger.bind(
-            original_length=len(text),
-            final_length=len(result),
-            replacements_made=replacements_made,
-            total_rules=len(replacements),
-        ).debug("Text replacements applied")
-        return "<br />".join(result)
+        joined = "<br />".join(text)
+        replacer = self.config.replacement_matcher
+        if replacer is None:
+            if is_level_enabled("DEBUG"):
+                logger.bind(text_length=len(text)).debug(
+                    "No replacement rules available"
+                )
+            return joined
+        result, replacements_made = replacer.subn(joined)
+        if is_level_enabled("DEBUG"):
+            logger.bind(
+                original_length=len(joined),
+                final_length=len(result),
+                replacements_made=replacements_made,
+                total_rules=len(replacer),
+            ).debug("Text replacements applied")
+        return result
 
     def apply_text_replacements_to_string(self, text: str) -> str:
         if not text:
             return ""
-        replacements = self.config.data.replacement_rules
-        if not replacements:
-            logger.bind(text_length=len(text)).debug(
-                "No replacement rules available for string"
-            )
+        replacer = self.config.replacement_matcher
+        if replacer is None:
+            if is_level_enabled("DEBUG"):
+                logger.bind(text_length=len(text)).debug(
+                    "No replacement rules available for string"
+                )
             return text
-        result = text
-        replacements_made = 0
-        for original, replacement in replacements.items():
-            if original in result:
-                result = result.replace(original, replacement)
-                replacements_made += 1
-        logger.bind(
-            original_text=text,
-            final_text=result,
-            replacements_made=replacements_made,
-            total_rules=len(replacements),
-        ).debug("String replacements applied")
+        result, replacements_made = replacer.subn(text)
+        if is_level_enabled("DEBUG"):
+            logger.bind(
+                original_text=text,
+                final_text=result,
+                replacements_made=replacements_made,
+                total_rules=len(replacer),
+            ).debug("String replacements applied")
         return result
 
     def is_dealer_excluded(self) -> bool:
-        dealer_exclusions = self.config.data.dealer_exclusions
+        dealer_exclusions = self.config.dealer_exclusions_lc
         if not dealer_exclusions:
-            logger.bind(dealer=self.dealer).debug(
-                "No dealer exclusions configured"
-            )
+            if is_level_enabled("DEBUG"):
+                logger.bind(dealer=self.dealer).debug(
+                    "No dealer exclusions configured"
+                )
             return False
-        excluded = self.dealer.lower() in [
-            dealer.lower() for dealer in dealer_exclusions
-        ]
-        logger.bind(
-            dealer=self.dealer,
-            is_excluded=excluded,
-            total_exclusions=len(dealer_exclusions),
-        ).debug("Dealer exclusion check completed")
+        excluded = self.dealer_lc in dealer_exclusions
+        if is_level_enabled("DEBUG"):
+            logger.bind(
+                dealer=self.dealer,
+                is_excluded=excluded,
+                total_exclusions=len(dealer_exclusions),
+            ).debug("Dealer exclusion check completed")
         return excluded
 
     def is_brand_excluded(self) -> bool:
-        brand_exclusions = self.config.data.brand_exclusions
+        brand_exclusions = self.config.brand_exclusions_set
         if not brand_exclusions:
-            logger.bind(brand=self.model).debug(
-                "No brand exclusions configured"
-            )
+            if is_level_enabled("DEBUG"):
+                logger.bind(brand=self.model).debug(
+                    "No brand exclusions configured"
+                )
             return False
         excluded = self.category in brand_exclusions
-        logger.bind(
-            brand=self.category,
-            is_excluded=excluded,
-            total_exclusions=len(brand_exclusions),
-        ).debug("Brand exclusion check completed")
+        if is_level_enabled("DEBUG"):
+            logger.bind(
+                brand=self.category,
+                is_excluded=excluded,
+                total_exclusions=len(brand_exclusions),
+            ).debug("Brand exclusion check completed")
         return excluded
 
     def check_exclusions(self) -> None:
@@ -295,37 +322,42 @@ class ProductModel(BaseModel):
                 f"Brand '{self.model}' is in exclusion list"
             )
 
-        logger.bind(
-            dealer=self.dealer,
-            brand=self.model,
-            url=self.url,
-        ).debug("Product passed all exclusion checks")
+        if is_level_enabled("DEBUG"):
+            logger.bind(
+                dealer=self.dealer,
+                brand=self.model,
+                url=self.url,
+            ).debug("Product passed all exclusion checks")
 
-    def get_processed_images(self) -> List[str]:
+    @cached_property
+    def processed_images(self) -> List[str]:
         if not self.images:
-            logger.debug("No images to process")
+            if is_level_enabled("DEBUG"):
+                logger.debug("No images to process")
             return []
         original_count = len(self.images)
-        image_exclusions = self.config.data.image_exclusions
+        rule = self.config.data.image_exclusion_rules.get(
+            self.dealer, _MISSING
+        )
 
         # Проверяем, есть ли дилер в списке исключений
-        if image_exclusions and self.dealer in image_exclusions:
-            rules = image_exclusions.get(self.dealer)
+        if rule is not _MISSING:
 
             # Если для дилера нет правил (пустая строка в CSV), возвращаем оригинальные фото
-            if not rules:
+            if rule is None:
                 logger.bind(dealer=self.dealer).warning(
                     "Dealer found in exclusion file, but no rules are defined."
                 )
                 return self.images
 
-            processed_images = self._apply_image_exclusions(self.images, rules)
-            logger.bind(
-                dealer=self.dealer,
-                original_count=original_count,
-                processed_count=len(processed_images),
-                rules=rules,
-            ).debug("Dealer-specific image exclusions applied")
+            processed_images = self._apply_image_exclusions(self.images, rule)
+            if is_level_enabled("DEBUG"):
+                logger.bind(
+                    dealer=self.dealer,
+                    original_count=original_count,
+                    processed_count=len(processed_images),
+                    rules=rule,
+                ).debug("Dealer-specific image exclusions applied")
             return processed_images
         else:
             # Глобальная проверка, если для дилера нет правил в файле
@@ -339,86 +371,46 @@ class ProductModel(BaseModel):
                 )
                 raise ModelExclusionError("No minimal images requirements")
 
-            logger.bind(final_count=original_count).debug(
-                "Images processed without exclusions"
-            )
+            if is_level_enabled("DEBUG"):
+                logger.bind(final_count=original_count).debug(
+                    "Images processed without exclusions"
+                )
             return self.images
 
     def _apply_image_exclusions(
-        self, images: List[str], rules: Dict[str, str]
+        self, images: List[str], rule: ImageExclusionRule
     ) -> List[str]:
         if not images:
             return images
 
-        result = images.copy()
-        original_count = len(result)
-        removed_images = []
+        positions, end_count = rule
+        if not positions and not end_count:
+            if is_level_enabled("DEBUG"):
+                logger.bind(dealer=self.dealer).debug(
+                    "Exclusion rules are empty, returning original images"
+                )
+            return images
 
-        start_remove = rules.get("НАЧАЛО") or rules.get("start", "")
-        end_remove = rules.get("КОНЕЦ") or rules.get("end", "")
+        original_count = len(images)
+        if positions:
+            result = [
+                image
+                for index, image in enumerate(images)
+                if index not in positions
+            ]
+            if end_count:
+                del result[-end_count:]
+        else:
+            result = images[:-end_count]
 
-        if not start_remove.strip() and not end_remove.strip():
-            logger.bind(dealer=self.dealer).debug(
-                "Exclusion rules are empty, returning original images"
-            )
-            return result
-
-        if start_remove and start_remove.strip():
-            positions_to_remove = []
-            try:
-                for pos_str in start_remove.split(","):
-                    pos_str = pos_str.strip()
-                    if pos_str.isdigit():
-                        pos = int(pos_str)
-                        if pos > 0:
-                            index = pos - 1
-                            if index < len(result):
-                                positions_to_remove.append(index)
-
-                positions_to_remove.sort(reverse=True)
-
-                for index in positions_to_remove:
-                    if index < len(result):
-                        removed_image = result.pop(index)
-                        removed_images.append(f"позиция {index + 1}")
-                        logger.bind(
-                            removed_position=index + 1,
-                            removed_image_url=removed_image[:50] + "...",
-                            remaining_count=len(result),
-                        ).debug("Removed image at specific position")
-
-            except (ValueError, IndexError) as e:
-                logger.bind(
-                    error=str(e),
-                    start_remove_value=start_remove,
-                ).warning("Failed to parse start positions for image removal")
-
-        if end_remove and end_remove.strip():
-            try:
-                count_to_remove = int(end_remove.strip())
-                if count_to_remove > 0:
-                    actual_remove = min(count_to_remove, len(result))
-                    for i in range(actual_remove):
-                        if result:
-                            removed_image = result.pop()
-                            removed_images.append(f"с конца {i + 1}")
-                            logger.bind(
-                                removed_image_url=removed_image[:50] + "...",
-                                remaining_count=len(result),
-                            ).debug("Removed image from end")
-            except (ValueError, TypeError) as e:
-                logger.bind(
-                    error=str(e),
-                    end_remove_value=end_remove,
-                ).warning("Failed to parse end count for image removal")
-
-        logger.bind(
-            dealer=self.dealer,
-            original_count=original_count,
-            final_count=len(result),
-            removed_images=removed_images,
-            rules_applied=rules,
-        ).debug("Image exclusions applied successfully")
+        if is_level_enabled("DEBUG"):
+            logger.bind(
+                dealer=self.dealer,
+                original_count=original_count,
+                final_count=len(result),
+                removed_count=original_count - len(result),
+                rules_applied=rule,
+            ).debug("Image exclusions applied successfully")
 
         if len(result) < self.config.parser.exclude_ads_pictures:
             logger.bind(
@@ -447,13 +439,16 @@ class ProductModel(BaseModel):
                 ).warning("Invalid exchange rate, using default")
                 exchange_rate = 0.24
             rub_price = eur_price / exchange_rate
-            formatted_price = f"{int(rub_price):,}".replace(",", " ")
-            logger.bind(
-                eur_price=eur_price,
-                exchange_rate=exchange_rate,
-                rub_price=int(rub_price),
-                formatted_price=formatted_price,
-            ).debug("Price conversion completed")
+            formatted_price = format(int(rub_price), ",d").translate(
+                _SPACE_TRANS
+            )
+            if is_level_enabled("DEBUG"):
+                logger.bind(
+                    eur_price=eur_price,
+                    exchange_rate=exchange_rate,
+                    rub_price=int(rub_price),
+                    formatted_price=formatted_price,
+                ).debug("Price conversion completed")
             return formatted_price
         except (ValueError, AttributeError) as e:
             logger.bind(
@@ -466,26 +461,13 @@ class ProductModel(BaseModel):
     def to_csv_dict(self) -> Dict[str, str]:
         try:
             # Basic required fields - these must be present
-            required_fields = {
-                "category": self.category,
-                "model": self.model,
-                "color": self.color,
-                "year_of_release": self.year_of_release,
-                "mileage": self.mileage,
-                "transmission": self.transmission,
-                "fuel": self.fuel,
-                "body": self.body,
-                "price": self.price,
-                "images": self.images,
-            }
-
             missing_required = [
                 field_name
-                for field_name, value in required_fields.items()
-                if value is None
-                or (isinstance(value, str) and not value.strip())
-                or (isinstance(value, list) and not value)
+                for field_name in _REQUIRED_STR_FIELDS
+                if not (getattr(self, field_name) or "").strip()
             ]
+            if not self.images:
+                missing_required.append("images")
 
             if missing_required:
                 logger.bind(
@@ -498,7 +480,7 @@ class ProductModel(BaseModel):
                 )
 
             self.check_exclusions()
-            processed_images = self.get_processed_images()
+            processed_images = self.processed_images
             if len(processed_images) < self.config.parser.exclude_ads_pictures:
                 raise ModelExclusionError(
                     "Product excluded due to insufficient images count"
@@ -535,11 +517,12 @@ class ProductModel(BaseModel):
                 "Tabs:1": self.formatted_tab_one,
                 "Tabs:2": self.formatted_tab_two,
             }
-            logger.bind(
-                total_fields=len(csv_dict),
-                processed_images_count=len(processed_images),
-                text_length=len(csv_dict.get("Text", "")),
-            ).info("CSV dictionary created successfully")
+            if is_level_enabled("INFO"):
+                logger.bind(
+                    total_fields=len(csv_dict),
+                    processed_images_count=len(processed_images),
+                    text_length=len(csv_dict.get("Text", "")),
+                ).info("CSV dictionary created successfully")
             return csv_dict
         except ModelExclusionError:
             logger.bind(
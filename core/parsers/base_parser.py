@@ -6,8 +6,32 @@ from bs4.element import PageElement
 from loguru import logger
 
 from core.models.product_model import ProductModel
+from shared.services.logger import is_level_enabled
 from shared.utils.html_parser import parse_markup
 
+_DIGITS_RE = re.compile(r"\d+")
+_WS_RE = re.compile(r"\s+")
+_NONNUM_RE = re.compile(r"[^\d.,]")
+_PAREN_RE = re.compile(r"\(([^)]+)\)")
+_POWER_UNIT_RE = re.compile(
+    r"\b(?:л\.?\s*с\.?|лс|ps|hp|bhp)\b", re.IGNORECASE
+)
+_CLEAN_TABLE = str.maketrans(
+    {
+        "\xa0": " ",
+        "\u200b": "",
+        "\u200c": "",
+        "\u200d": "",
+        "\u2060": "",
+        "\u202f": " ",
+        "\u2028": " ",
+        "\u2029": " ",
+        "\t": " ",
+        "\n": " ",
+        "\r": " ",
+    }
+)
+
 
 class BaseParser(ABC):
     def __init__(self, raw_html: str, base_url: str, url):
@@ -43,15 +67,7 @@ class BaseParser(ABC):
         try:
             if hasattr(element, "get"):
                 value = element.get(attribute)
-                result = str(value) if value else ""
-
-                self.parser_logger.bind(
-                    attribute_name=attribute,
-                    attribute_value=result,
-                    has_value=bool(result),
-                ).debug("Attribute extraction completed")
-
-                return result
+                return str(value) if value else ""
             else:
                 return ""
         except (AttributeError, TypeError) as e:
@@ -63,13 +79,9 @@ class BaseParser(ABC):
 
     def parse_price(self, price_text: str) -> Optional[str]:
         try:
-            price = re.findall(r"\d+", price_text)
+            price = _DIGITS_RE.findall(price_text)
             if price:
-                result = "".join(price)
-                self.parser_logger.bind(
-                    extracted_price=result,
-                ).debug("Price parsing completed")
-                return result
+                return "".join(price)
             return None
         except Exception as e:
             self.parser_logger.bind(
@@ -85,15 +97,9 @@ class BaseParser(ABC):
 
             cleaned_text = self.clean_text(text)
 
-            numbers = re.findall(r"\d+", cleaned_text)
+            numbers = _DIGITS_RE.findall(cleaned_text)
             if numbers:
-                result = "".join(numbers)
-                self.parser_logger.bind(
-                    original_text=text,
-                    cleaned_text=cleaned_text,
-                    extracted_numbers=result,
-                ).debug("Numbers extracted successfully")
-                return result
+                return "".join(numbers)
             return None
         except Exception as e:
             self.parser_logger.bind(
@@ -113,33 +119,34 @@ class BaseParser(ABC):
 
             # Look for power in parentheses (usually horsepower)
             # Pattern matches content inside parentheses
-            paren_match = re.search(r"\(([^)]+)\)", cleaned_text)
+            paren_match = _PAREN_RE.search(cleaned_text)
             if paren_match:
                 paren_content = paren_match.group(1)
                 # Check if parentheses contain power units using regex for more flexibility
-                power_unit_pattern = r"\b(?:л\.?\s*с\.?|лс|ps|hp|bhp)\b"
-                if re.search(power_unit_pattern, paren_content, re.IGNORECASE):
-                    numbers_in_paren = re.findall(r"\d+", paren_content)
+                if _POWER_UNIT_RE.search(paren_content):
+                    numbers_in_paren = _DIGITS_RE.findall(paren_content)
                     if numbers_in_paren:
                         result = numbers_in_paren[
                             0
                         ]  # Take first number (usually the main value)
-                        self.parser_logger.bind(
-                            original_text=text,
-                            extracted_power=result,
-                            source="parentheses",
-                        ).debug("Power extracted from parentheses")
+                        if is_level_enabled("DEBUG"):
+                            self.parser_logger.bind(
+                                original_text=text,
+                                extracted_power=result,
+                                source="parentheses",
+                            ).debug("Power extracted from parentheses")
                         return result
 
             # If no valid power in parentheses, take first number (kW)
-            numbers = re.findall(r"\d+", cleaned_text)
+            numbers = _DIGITS_RE.findall(cleaned_text)
             if numbers:
                 result = numbers[0]  # Take first number
-                self.parser_logger.bind(
-                    original_text=text,
-                    extracted_power=result,
-                    source="first_number",
-                ).debug("Power extracted as first number")
+                if is_level_enabled("DEBUG"):
+                    self.parser_logger.bind(
+                        original_text=text,
+                        extracted_power=result,
+                        source="first_number",
+                    ).debug("Power extracted as first number")
                 return result
 
             return None
@@ -155,25 +162,8 @@ class BaseParser(ABC):
         if not text:
             return ""
 
-        replacements = {
-            "\xa0": " ",
-            "\u200b": "",
-            "\u200c": "",
-            "\u200d": "",
-            "\u2060": "",
-            "\u202f": " ",
-            "\u2028": " ",
-            "\u2029": " ",
-            "\t": " ",
-            "\n": " ",
-            "\r": " ",
-        }
-
-        cleaned = text
-        for old, new in replacements.items():
-            cleaned = cleaned.replace(old, new)
-
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = text.translate(_CLEAN_TABLE)
+        cleaned = _WS_RE.sub(" ", cleaned)
         return cleaned.strip()
 
     def extract_year_from_date(self, date_str: str) -> str:
@@ -199,7 +189,7 @@ class BaseParser(ABC):
             return ""
 
         cleaned = self.clean_text(number)
-        cleaned = re.sub(r"[^\d.,]", "", cleaned)
+        cleaned = _NONNUM_RE.sub("", cleaned)
         cleaned = cleaned.replace(",", ".")
 
         parts = cleaned.split(".")
@@ -94,8 +94,7 @@ class MobileDeRuParser(BaseParser):
             self.mobilede_logger.bind(
                 error_type="no_html_content",
             ).warning("No HTML content available for data parsing")
-            data["config"] = config
-            return ProductModel(**data)
+            return ProductModel.model_construct(config=config, **data)
 
         try:
             self._extract_title_fields(data)
@@ -122,8 +121,8 @@ class MobileDeRuParser(BaseParser):
             extracted_fields=list(data.keys()),
         ).success("Data parsing completed")
 
-        data["config"] = config
-        return ProductModel(**data)
+        # Every extracted value is already a str or list of str
+        return ProductModel.model_construct(config=config, **data)
 
     def _extract_title_fields(self, data: Dict) -> None:
         try:
@@ -698,7 +698,7 @@ class ParserService:
             ).error("Error creating SQL dump")
             return False
 
-    async def export_from_database(self) -> Optional[Tuple[List[Path], int]]:
+    def export_from_database(self) -> Optional[Tuple[List[Path], int]]:
         """Export all products from database to archives.
 
         Returns:
@@ -708,7 +708,7 @@ class ParserService:
         try:
             self.service_logger.info("Starting database export")
 
-            result = await save_products_from_database(self.config_obj)
+            result = save_products_from_database(self.config_obj)
 
             if result:
                 archive_paths, saved_count = result
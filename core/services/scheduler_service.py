@@ -12,6 +12,7 @@ from core.parsers.mobilede_ru_parser import MobileDeRuParser
 from core.services.parser_service import ParserService
 from shared.config.config_model import ConfigModel
 from shared.exceptions.request_exceptions import OutOfProxiesException
+from shared.utils.tasks import cancel_and_await
 
 
 class SchedulerService:
@@ -218,12 +219,7 @@ class SchedulerService:
         self.scheduler_logger.info("Stopping scheduler")
         self.is_running = False
 
-        if self.current_task and not self.current_task.done():
-            self.current_task.cancel()
-            try:
-                await self.current_task
-            except asyncio.CancelledError:
-                pass
+        await cancel_and_await((self.current_task,))
 
         await self.parser_service.close()
 
@@ -1,8 +1,11 @@
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Literal, Self, Set
+from typing import Dict, List, Literal, NamedTuple, Optional, Self, Set
 
+from loguru import logger
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     computed_field,
     field_validator,
@@ -10,6 +13,7 @@ from pydantic import (
 )
 
 from shared.utils.generate_links import generate_links
+from shared.utils.text_replacer import TextReplacer
 
 
 class LoggingConfig(BaseModel):
@@ -156,6 +160,15 @@ class ApiConfig(BaseModel):
     tg_users: Set[int] = Field(default=set())
 
 
+class WebhookConfig(BaseModel):
+    enabled: bool = Field(default=False)
+    url: str = Field(default="")
+    path: str = Field(default="/webhook")
+    host: str = Field(default="0.0.0.0")
+    port: int = Field(default=8080)
+    secret_token: str = Field(default="")
+
+
 class DatabaseConfig(BaseModel):
     id: str = Field(default="id")
     title: str = Field(default="Title")
@@ -187,7 +200,48 @@ class DatabaseConfig(BaseModel):
     created_at: str = Field(default="Дата создания")
 
 
+class ImageExclusionRule(NamedTuple):
+    # Индексы фото (с нуля), удаляемых с начала
+    positions: frozenset[int]
+    # Количество фото, удаляемых с конца
+    end_count: int
+
+
+def parse_image_exclusion_rule(
+    dealer: str, rules: Dict[str, str]
+) -> Optional[ImageExclusionRule]:
+    if not rules:
+        return None
+
+    start_remove = (
+        rules.get("НАЧАЛО") or rules.get("start") or ""
+    ).strip()
+    end_remove = (rules.get("КОНЕЦ") or rules.get("end") or "").strip()
+
+    positions = frozenset(
+        int(pos) - 1
+        for pos in start_remove.split(",")
+        if pos.strip().isdecimal() and int(pos) > 0
+    )
+
+    end_count = 0
+    if end_remove:
+        try:
+            end_count = max(int(end_remove), 0)
+        except ValueError as e:
+            logger.bind(
+                service="Config",
+                dealer=dealer,
+                error=str(e),
+                end_remove_value=end_remove,
+            ).warning("Failed to parse end count for image removal")
+
+    return ImageExclusionRule(positions=positions, end_count=end_count)
+
+
 class DataConfig(BaseModel):
+    model_config = ConfigDict(ignored_types=(cached_property,))
+
     replacement_rules: Dict[str, str] = Field(
         default_factory=dict, min_length=1
     )
@@ -195,6 +249,29 @@ class DataConfig(BaseModel):
     image_exclusions: Dict[str, Dict[str, str]] = Field(default_factory=dict)
     brand_exclusions: List[str] = Field(default_factory=list)
 
+    @cached_property
+    def replacement_matcher(self) -> Optional[TextReplacer]:
+        if not self.replacement_rules:
+            return None
+        return TextReplacer(self.replacement_rules)
+
+    @cached_property
+    def image_exclusion_rules(
+        self,
+    ) -> Dict[str, Optional[ImageExclusionRule]]:
+        return {
+            dealer: parse_image_exclusion_rule(dealer, rules)
+            for dealer, rules in self.image_exclusions.items()
+        }
+
+    @cached_property
+    def dealer_exclusions_lc(self) -> frozenset[str]:
+        return frozenset(dealer.lower() for dealer in self.dealer_exclusions)
+
+    @cached_property
+    def brand_exclusions_set(self) -> frozenset[str]:
+        return frozenset(self.brand_exclusions)
+
 
 class ConfigModel(BaseModel):
     logging: LoggingConfig
@@ -203,6 +280,20 @@ class ConfigModel(BaseModel):
     templates: TemplatesConfig
     calculation: CalculationConfig
     api: ApiConfig
+    webhook: WebhookConfig = Field(default_factory=WebhookConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     data: DataConfig = Field(default_factory=DataConfig)
     ai: AIConfig = Field(default_factory=AIConfig)
+
+    @property
+    def replacement_matcher(self) -> Optional[TextReplacer]:
+        # Cached on DataConfig, which the loader swaps in after validation.
+        return self.data.replacement_matcher
+
+    @property
+    def dealer_exclusions_lc(self) -> frozenset[str]:
+        return self.data.dealer_exclusions_lc
+
+    @property
+    def brand_exclusions_set(self) -> frozenset[str]:
+        return self.data.brand_exclusions_set
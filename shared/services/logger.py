@@ -4,6 +4,23 @@ from typing import List, Literal, Optional
 
 from loguru import logger
 
+_LEVEL_NO = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+# Loguru's default stderr sink accepts DEBUG until init_logger runs.
+_min_level_no = _LEVEL_NO["DEBUG"]
+
+
+def is_level_enabled(level: str) -> bool:
+    return _LEVEL_NO[level] >= _min_level_no
+
 
 def init_logger(
     console_level: Literal[
@@ -22,9 +39,15 @@ def init_logger(
     modules: Optional[List[str]] = None,
     log_dir: Path = Path("logs"),
 ) -> None:
+    global _min_level_no
 
     logger.remove()
 
+    sink_levels = [console_level, file_level, "ERROR"]
+    if modules:
+        sink_levels.append("DEBUG")
+    _min_level_no = min(_LEVEL_NO[level] for level in sink_levels)
+
     console_format = (
         "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
         "<level>{level: <8}</level> | "
@@ -4,19 +4,26 @@ from loguru import logger
 
 from shared.exceptions.html_exceptions import HTMLParsingError
 
+FALLBACK_FEATURES = "html.parser"
+
+# Парсер для BeautifulSoup; заменяется на html.parser, если lxml недоступен
+_features = "lxml"
+
 
 def parse_markup(html: str) -> BeautifulSoup:
+    global _features
+
     try:
-        logger.bind(service="HTMLParser").debug("Parsing HTML with lxml...")
-        return BeautifulSoup(html, "lxml")
+        return BeautifulSoup(html, _features)
     except FeatureNotFound as e:
         logger.bind(
             service="HTMLParser",
             error_type=type(e).__name__,
             error_message=str(e),
         ).warning("lxml parser not available, falling back to html.parser")
+        _features = FALLBACK_FEATURES
         try:
-            return BeautifulSoup(html, "html.parser")
+            return BeautifulSoup(html, FALLBACK_FEATURES)
         except Exception as fallback_error:
             raise HTMLParsingError(
                 f"Both lxml and html.parser failed: {fallback_error}"
@@ -51,7 +51,7 @@ def read_csv_file(file_path: Path, delimiter: str = ";"):
     return []
 
 
-async def save_products_from_database(
+def save_products_from_database(
     config: ConfigModel,
 ) -> Optional[Tuple[List[Path], int]]:
     """Export products from database to CSV archives using streaming.
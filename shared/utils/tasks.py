@@ -0,0 +1,9 @@
+import asyncio
+from typing import Iterable, Optional
+
+
+async def cancel_and_await(tasks: Iterable[Optional[asyncio.Task]]) -> None:
+    pending = [task for task in tasks if task is not None and not task.done()]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,40 @@
+import re
+from typing import Dict, Tuple
+
+# Short fields (fuel, body, colour, ...) repeat across the whole run, so
+# their results are memoised; long descriptions are not.
+MEMO_MAX_TEXT_LENGTH = 128
+MEMO_MAX_ENTRIES = 4096
+
+
+class TextReplacer:
+    __slots__ = ("rules", "_pattern", "_memo")
+
+    def __init__(self, rules: Dict[str, str]):
+        self.rules = rules
+        self._memo: Dict[str, Tuple[str, int]] = {}
+
+        # Longer keys go first so the alternation prefers the longest match.
+        keys = sorted(rules, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, keys)))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def subn(self, text: str) -> Tuple[str, int]:
+        if len(text) > MEMO_MAX_TEXT_LENGTH:
+            return self._subn(text)
+
+        cached = self._memo.get(text)
+        if cached is None:
+            cached = self._subn(text)
+            if len(self._memo) < MEMO_MAX_ENTRIES:
+                self._memo[text] = cached
+        return cached
+
+    def _subn(self, text: str) -> Tuple[str, int]:
+        return self._pattern.subn(self._replace_match, text)
+
+    def _replace_match(self, match: re.Match) -> str:
+        return self.rules[match.group(0)]
+